@@ -1,133 +1,641 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import atexit
+import concurrent.futures
+import hashlib
+import json
 import logging
 import getpass
+import os
+import queue
+import threading
+import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    TimeoutException, UnexpectedAlertPresentException,
-    NoSuchElementException
-)
+from selenium.common.exceptions import TimeoutException
+
+# requests + lxml이 설치되어 있으면 글 목록을 일반 HTTP로 추출한다
+# (chromedriver 왕복/렌더링이 없어 훨씬 빠름). 없으면 Selenium 경로로 동작.
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+    etree = None
+
+# selectolax(Lexbor C 바인딩)가 있으면 HTML 파싱에 우선 사용한다
+# (이 워크로드에선 lxml보다 파싱+CSS 선택이 더 빠르다)
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# 동시에 띄울 삭제용 헤드리스 Chrome 개수
+MAX_DELETE_WORKERS = 4
+
+# 일시적 네트워크 오류에 대한 페이지 로드 재시도 횟수 (지수 백오프)
+PAGE_LOAD_RETRIES = 2
+
+# 자주 쓰는 로케이터는 모듈 상수로 한 번만 만든다.
+# 참고: 삭제 버튼은 "button.delete" 복합 선택자라 By.CLASS_NAME으로는
+# 매칭되지 않는다 — By.CSS_SELECTOR가 맞다.
+LOC_USERNAME_FIELD = (By.NAME, "username")
+LOC_PASSWORD_FIELD = (By.NAME, "password")
+LOC_POST_LIST = (By.CLASS_NAME, "post-list")
+LOC_DELETE_BUTTON = (By.CSS_SELECTOR, "button.delete")
+
+# 목록에서 걸러낼 오르비 시스템 문구 — 새 문구가 생기면 여기에만 추가하면 된다
+_DELETED_TITLES = frozenset({
+    "회원에 의해 삭제된 글입니다.",
+})
+
+# 삭제 엔드포인트가 쓸 수 있는 CSRF hidden input 이름들 (발견된 이름
+# 그대로 POST에 실어 보낸다 — 규약이 다른 토큰을 _token으로 보내면
+# 서버가 전부 거부하면서도 "찾았다"고 HTTP 경로를 타게 되기 때문)
+_CSRF_INPUT_NAMES = ("csrfmiddlewaretoken", "_token", "csrf_token")
+
+# 스크래핑에는 ul.post-list 마크업만 필요하므로 무거운 리소스는 CDP로 차단한다
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff*", "*.ttf", "*.mp4", "*analytics*", "*ads*",
+]
+
+# HTTP 추출 경로에서 쓰는 미리 컴파일된 XPath (페이지마다 재컴파일하지 않음)
+if etree is not None:
+    _POST_LIST_XP = etree.XPath("//ul[contains(@class, 'post-list')]")
+    _POST_ITEMS_XP = etree.XPath("//ul[contains(@class, 'post-list')]/li")
+    _TITLE_XP = etree.XPath(".//p[contains(@class, 'title')]")
+    _LINK_HREF_XP = etree.XPath(".//a/@href")
+    _CSRF_INPUT_XP = etree.XPath("//input[@name=$name]/@value")
+    _CSRF_META_XP = etree.XPath("//meta[@name='csrf-token']/@content")
+
 
 # -------------------- 공통 유틸 함수 --------------------
 
-def wait_for_element(driver, by, value, timeout=30):
+# 페이지의 모든 글을 브라우저 안에서 한 번에 추출하는 비동기 JS.
+# post-list가 나타날 때까지 브라우저 안에서 직접 폴링한 뒤 {title, href}
+# 목록을 통째로 콜백으로 돌려주므로, 페이지당 WebDriver HTTP 요청이
+# (대기 폴링 포함) 단 한 번이다. post-list가 8초 안에 안 나타나면 null.
+# innerText 대신 textContent를 읽어 가시성(레이아웃) 계산도 건너뛴다.
+_EXTRACT_POSTS_ASYNC_JS = """
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + 8000;
+const poll = setInterval(() => {
+    const list = document.querySelector('ul.post-list');
+    if (list) {
+        clearInterval(poll);
+        done(Array.from(list.querySelectorAll(':scope > li')).map(li => {
+            const t = li.querySelector('p.title');
+            const a = li.querySelector('a');
+            return {
+                title: t ? t.textContent.trim() : null,
+                href: (a && a.href) ? a.href.split('/').pop() : null
+            };
+        }));
+    } else if (Date.now() > deadline) {
+        clearInterval(poll);
+        done(null);
+    }
+}, 100);
+"""
+
+# 같은 (드라이버, 타임아웃) 조합이면 WebDriverWait를 재사용한다
+_WAIT_CACHE = {}
+
+
+def _get_wait(driver, timeout):
+    """
+    Return a cached WebDriverWait for this (driver, timeout) pair,
+    creating it on first use.
+    """
+    key = (id(driver), timeout)
+    wait = _WAIT_CACHE.get(key)
+    if wait is None:
+        wait = _WAIT_CACHE[key] = WebDriverWait(driver, timeout)
+    return wait
+
+
+def wait_for_element(driver, locator, timeout=30):
     """
-    Wait for an element to be located and return it.
+    Wait for an element matching the (by, value) locator and return it.
     """
     try:
-        return WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
+        return _get_wait(driver, timeout).until(EC.presence_of_element_located(locator))
     except TimeoutException:
+        by, value = locator
         logging.error(f"Element with {by} = {value} not found within {timeout} seconds.")
         return None
 
 
-def handle_alert(driver, timeout=5):
+def wait_ready(driver, timeout=8):
     """
-    Handles an alert if it appears within the specified timeout period.
+    Wait until document.readyState reports the DOM is usable.
+
+    요소 presence 폴링(폴링마다 WebDriver 왕복 한 번)을 시작하기 전에
+    이걸 먼저 호출해 두면, 페이지가 아직 로딩 중일 때의 헛된 폴링을
+    건너뛰고 다음 find_element가 보통 첫 시도에 성공한다.
+    (eager 로드 전략에 맞춰 interactive 상태도 통과로 본다.)
     """
     try:
-        alert = WebDriverWait(driver, timeout).until(EC.alert_is_present())
-        logging.info(f"Alert detected: {alert.text}")
-        alert.accept()
-        logging.info("Alert accepted.")
-        return True
+        _get_wait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState")
+            in ("interactive", "complete")
+        )
     except TimeoutException:
-        logging.info("No alert appeared.")
+        logging.warning(f"Page not ready within {timeout} seconds; polling elements anyway.")
+
+
+def _build_chrome_options():
+    """
+    Build the headless Chrome options shared by the login driver
+    and the delete worker processes.
+    """
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920x1080")
+    # 이미지/스타일시트/폰트는 추출에 쓰이지 않으므로 로드하지 않는다
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    # DOMContentLoaded 시점에 driver.get이 반환되도록 (load 이벤트까지 안 기다림)
+    chrome_options.page_load_strategy = "eager"
+    return chrome_options
+
+
+def _create_driver():
+    """
+    Launch a headless Chrome and block heavy resource URLs via CDP.
+    """
+    driver = webdriver.Chrome(options=_build_chrome_options())
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        # CDP를 지원하지 않는 드라이버라도 동작 자체는 계속한다
+        logging.warning(f"Failed to set up CDP resource blocking: {e}")
+    return driver
+
+
+# 로그인/추출에 쓰는 메인 드라이버 — 로그인 재시도 간에 재사용하고
+# 창을 닫을 때만 종료한다
+_main_driver = None
+
+
+def _get_driver():
+    """
+    Return the shared headless Chrome, launching it on first use.
+    Retrying a failed login reuses the same browser instead of paying
+    the chromedriver + Chrome startup cost again.
+    """
+    global _main_driver
+    if _main_driver is None:
+        _main_driver = _create_driver()
+    return _main_driver
+
+
+# 삭제 워커 프로세스마다 하나씩 유지하는 드라이버
+_worker_driver = None
+
+
+def _init_delete_worker(cookies):
+    """
+    Initializer for each delete worker process: launch a headless Chrome
+    and seed it with the logged-in session's cookies.
+    """
+    global _worker_driver
+    _worker_driver = _create_driver()
+    # 쿠키를 넣으려면 먼저 같은 도메인에 접속해 있어야 한다
+    _worker_driver.get("https://orbi.kr")
+    for cookie in cookies:
+        try:
+            _worker_driver.add_cookie(cookie)
+        except Exception as e:
+            logging.warning(f"Failed to add cookie {cookie.get('name')}: {e}")
+    atexit.register(_worker_driver.quit)
+
+
+def _delete_post_worker(post_number):
+    """
+    Run one deletion in the worker's own driver. Returns True on success
+    so the GUI can tell confirmed deletions from failed ones.
+    """
+    return delete_post(_worker_driver, post_number)
+
+
+def _fetch_csrf_token(session, post_number):
+    """
+    Fetch one modify page over HTTP and scrape the CSRF token the delete
+    endpoint expects. Returns a (필드명, 값) tuple — 필드명 is the hidden
+    input's name, or None when the token came from the csrf-token meta tag
+    (meta 토큰은 헤더로 보내야 한다). Returns None when no token can be
+    found, in which case deletion falls back to the Selenium path.
+    """
+    try:
+        resp = session.get(f"https://orbi.kr/modify/{post_number}", timeout=10)
+        resp.raise_for_status()
+    except Exception as e:
+        logging.error(f"Failed to fetch CSRF token: {e}")
+        return None
+
+    if HTMLParser is not None:
+        tree = HTMLParser(resp.content)
+        for name in _CSRF_INPUT_NAMES:
+            node = tree.css_first(f"input[name='{name}']")
+            if node is not None and node.attributes.get("value"):
+                return name, node.attributes["value"]
+        node = tree.css_first("meta[name='csrf-token']")
+        if node is not None and node.attributes.get("content"):
+            return None, node.attributes["content"]
+    else:
+        tree = lxml.html.fromstring(resp.content)
+        for name in _CSRF_INPUT_NAMES:
+            values = _CSRF_INPUT_XP(tree, name=name)
+            if values and values[0]:
+                return name, values[0]
+        values = _CSRF_META_XP(tree)
+        if values and values[0]:
+            return None, values[0]
+
+    logging.warning("No CSRF token found on the modify page.")
+    return None
+
+
+def delete_post_http(session, post_number, token):
+    """
+    Delete a post with one direct HTTP POST instead of a full page
+    navigation + button click + alert round-trip. Returns True on success.
+
+    token은 _fetch_csrf_token이 돌려준 (필드명, 값) 튜플이다. hidden input
+    토큰은 발견된 필드명 그대로 폼에 싣고, meta 태그 토큰(필드명 None)은
+    X-CSRF-TOKEN 헤더로 보낸다 — 페이지가 쓰는 규약과 다르게 보내면
+    서버가 전부 거부한다.
+    """
+    field, value = token
+    data = {"_method": "delete"}
+    headers = {"Referer": f"https://orbi.kr/modify/{post_number}"}
+    if field is None:
+        headers["X-CSRF-TOKEN"] = value
+    else:
+        data[field] = value
+
+    try:
+        resp = session.post(
+            f"https://orbi.kr/modify/{post_number}",
+            data=data,
+            headers=headers,
+            timeout=10,
+        )
+        resp.raise_for_status()
+        logging.info(f"Post {post_number} deleted via HTTP.")
+        return True
+    except Exception as e:
+        logging.error(f"Failed to delete post {post_number} via HTTP: {e}")
         return False
 
 
 def delete_post(driver, post_number):
     """
     Navigate to a post's modify page and delete the post.
-    Handle confirmation alerts if they appear.
+    confirm/alert를 미리 무력화하므로 알럿 대기가 없다.
+    Returns True when the deletion was confirmed (delete_post_http와 동일).
     """
     try:
         logging.info(f"Attempting to delete post: {post_number}")
         driver.get(f"https://orbi.kr/modify/{post_number}")
 
-        delete_btn = wait_for_element(driver, By.CLASS_NAME, "button.delete")
+        delete_btn = wait_for_element(driver, LOC_DELETE_BUTTON)
         if not delete_btn:
             logging.error(f"Delete button not found for post {post_number}.")
-            return
+            return False
 
-        delete_btn.click()
-        # 오르비에서 실제 삭제 확인 알럿이 뜨면 처리
-        if handle_alert(driver):
+        # 확인 알럿이 아예 뜨지 않도록 confirm/alert를 먼저 무력화하고,
+        # 브라우저 안에서 동기적으로 처리되는 JS 클릭을 사용한다
+        driver.execute_script("window.confirm = () => true; window.alert = () => true;")
+        driver.execute_script("arguments[0].click();", delete_btn)
+
+        # 삭제되면 modify 페이지를 벗어나므로 URL 변화만 짧게 확인
+        try:
+            _get_wait(driver, 2).until(lambda d: "/modify/" not in d.current_url)
             logging.info(f"Post {post_number} deletion confirmed.")
-        else:
-            logging.warning("No confirmation alert appeared. Deletion may not have been confirmed.")
+            return True
+        except TimeoutException:
+            logging.warning(
+                f"Could not confirm deletion of post {post_number} (still on modify page)."
+            )
+            return False
 
     except Exception as e:
         logging.error(f"Failed to delete post {post_number}: {e}")
+        return False
+
+
+def _cache_path(username):
+    """
+    Per-user cache file path (username is hashed so it never lands on disk).
+    """
+    digest = hashlib.sha1(username.encode("utf-8")).hexdigest()
+    return os.path.expanduser(f"~/.orbiclean-{digest}.json")
+
+
+def _load_cached_posts(username):
+    """
+    Load the post list from the previous scan, or [] when there is none.
+    """
+    try:
+        with open(_cache_path(username), encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("posts", [])
+    except (OSError, ValueError):
+        return []
+
+
+def _save_cached_posts(username, posts):
+    """
+    Persist the scanned post list so the next session can scan incrementally.
+    """
+    try:
+        with open(_cache_path(username), "w", encoding="utf-8") as f:
+            json.dump({"ts": time.time(), "posts": posts}, f, ensure_ascii=False)
+    except OSError as e:
+        logging.warning(f"Failed to write post cache: {e}")
 
 
-def extract_posts(driver):
+def _merge_cached_tail(posts, cached_posts, href):
+    """
+    이전 스캔에서 알던 글(href)을 다시 만난 시점부터는 목록이 변하지
+    않았다고 보고, 캐시된 목록의 그 지점부터 끝까지를 이어붙인다.
+    """
+    for i, cached in enumerate(cached_posts):
+        if cached["href"] == href:
+            posts.extend(cached_posts[i:])
+            break
+    return posts
+
+
+def _parse_posts_html(html):
+    """
+    목록 페이지 HTML에서 (post-list 존재 여부, [{'title', 'href'}] 목록)을
+    뽑는다. selectolax가 있으면 그것으로, 없으면 lxml로 파싱한다 —
+    어느 쪽이든 선택/순회는 전부 C에서 일어난다.
+    """
+    items = []
+
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        if tree.css_first("ul.post-list") is None:
+            return False, items
+        for li in tree.css("ul.post-list > li"):
+            t = li.css_first("p.title")
+            a = li.css_first("a")
+            raw_href = a.attributes.get("href") if a else None
+            items.append({
+                "title": (t.text(strip=True) or None) if t else None,
+                "href": raw_href.rstrip("/").rsplit("/", 1)[-1] if raw_href else None,
+            })
+        return True, items
+
+    tree = lxml.html.fromstring(html)
+    if not _POST_LIST_XP(tree):
+        return False, items
+    for li in _POST_ITEMS_XP(tree):
+        title_nodes = _TITLE_XP(li)
+        hrefs = _LINK_HREF_XP(li)
+        items.append({
+            "title": (title_nodes[0].text_content().strip() or None) if title_nodes else None,
+            "href": hrefs[0].rstrip("/").rsplit("/", 1)[-1] if hrefs else None,
+        })
+    return True, items
+
+
+def build_session(driver):
+    """
+    Copy the logged-in driver's cookies into a requests.Session so
+    pagination can run over plain HTTP instead of WebDriver commands.
+    Returns None when requests (or any HTML parser) is not installed.
+    """
+    if requests is None or (HTMLParser is None and lxml is None):
+        return None
+    sess = requests.Session()
+    for cookie in driver.get_cookies():
+        sess.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+    return sess
+
+
+def extract_posts(driver, session=None, cached_posts=None):
     """
     Extract all posts from the user's post list,
     skipping '회원에 의해 삭제된 글입니다.'
 
+    build_session으로 만든 requests.Session이 있으면 일반 HTTP + lxml로
+    페이지를 훑고(WebDriver 왕복 없음), 없으면 Selenium 드라이버로 돌아간다.
+    cached_posts(이전 스캔 결과)가 주어지면 이미 알던 글을 만나는 순간
+    캐시 꼬리를 이어붙이고 남은 페이지 탐색을 생략한다.
+
+    Returns a (posts, complete) tuple. complete는 목록 끝까지 훑었을 때만
+    True이고, 네트워크 오류/레이아웃 변화로 중간에 끊겼으면 False다 —
+    중간에 끊긴 목록을 캐시하면 다음 증분 스캔이 거기서 멈춰버리므로
+    호출 쪽은 complete한 결과만 저장해야 한다.
+    """
+    if session is not None:
+        return _extract_posts_http(session, cached_posts)
+    return _extract_posts_selenium(driver, cached_posts)
+
+
+def _extract_posts_http(session, cached_posts=None):
+    """
+    HTTP pagination loop: fetch /my/post?page=N with requests and parse
+    the post list natively (selectolax or lxml) via _parse_posts_html.
+    """
+    posts = []
+    page = 1
+    known_hrefs = {p["href"] for p in cached_posts} if cached_posts else frozenset()
+
+    while True:
+        logging.info(f"Processing page {page}...")
+        resp = None
+        for attempt in range(PAGE_LOAD_RETRIES + 1):
+            try:
+                resp = session.get(f"https://orbi.kr/my/post?page={page}", timeout=10)
+                resp.raise_for_status()
+                break
+            except Exception as e:
+                logging.warning(f"Error occurred while loading page {page}: {e}")
+                resp = None
+                if attempt < PAGE_LOAD_RETRIES:
+                    time.sleep(0.5 * 2 ** attempt)
+        if resp is None:
+            # 재시도까지 실패 — 목록 끝이 아니라 스캔이 끊긴 것
+            logging.info("Stopping pagination due to page load error.")
+            return posts, False
+
+        # post-list가 사라지면 목록 끝에 도달한 것
+        has_list, items = _parse_posts_html(resp.content)
+        if not has_list:
+            logging.info(f"Post list not found on page {page}. End of pagination.")
+            return posts, True
+
+        if not items:
+            logging.info(f"No posts found on page {page}. Checking the next page anyway...")
+
+        for item in items:
+            title = item["title"]
+            href = item["href"]
+
+            # "회원에 의해 삭제된 글입니다." 등 시스템 문구는 제외
+            if title in _DELETED_TITLES:
+                continue
+
+            # 이전 스캔에서 알던 글부터는 캐시로 대체하고 탐색 종료
+            # (캐시는 완주한 스캔만 저장되므로 결과도 완전하다)
+            if href in known_hrefs:
+                logging.info(f"Reached previously scanned post {href}. Using cached tail.")
+                return _merge_cached_tail(posts, cached_posts, href), True
+
+            if title and href:
+                posts.append({"title": title, "href": href})
+
+        page += 1
+
+
+def _extract_posts_selenium(driver, cached_posts=None):
+    """
+    Selenium fallback for the pagination loop.
+
     - If a page has no valid posts, we still try the next page,
       because Orbi might have valid posts on later pages.
     - We only stop if we cannot load the page or can't find 'post-list',
-      or if a 'no such element' error occurs (i.e. p.title not found).
+      or if the post titles disappear (layout change).
     """
     posts = []
     page = 1
+    known_hrefs = {p["href"] for p in cached_posts} if cached_posts else frozenset()
+    # 비동기 추출 JS(최대 8초 폴링)가 끝나기 전에 끊기지 않도록
+    driver.set_script_timeout(10)
 
     while True:
         logging.info(f"Processing page {page}...")
+        loaded = False
+        for attempt in range(PAGE_LOAD_RETRIES + 1):
+            try:
+                driver.get(f"https://orbi.kr/my/post?page={page}")
+                loaded = True
+                break
+            except Exception as e:
+                logging.warning(f"Error occurred while loading page {page}: {e}")
+                if attempt < PAGE_LOAD_RETRIES:
+                    time.sleep(0.5 * 2 ** attempt)
+        if not loaded:
+            # 재시도까지 실패 — 목록 끝이 아니라 스캔이 끊긴 것
+            logging.info("Stopping pagination due to page load error.")
+            return posts, False
+
+        # post-list 대기 + 추출을 비동기 JS 한 번으로 처리
         try:
-            driver.get(f"https://orbi.kr/my/post?page={page}")
+            page_posts = driver.execute_async_script(_EXTRACT_POSTS_ASYNC_JS)
         except Exception as e:
-            logging.error(f"Error occurred while loading page {page}: {e}")
-            logging.info("Stopping pagination due to page load error.")
-            break
+            logging.warning(f"Failed to extract post details: {e}")
+            return posts, False
 
-        # post-list 없으면 중단
-        if not wait_for_element(driver, By.CLASS_NAME, "post-list", timeout=10):
-            logging.error(f"Post list not found on page {page}. Stopping pagination.")
-            break
+        # post-list가 8초 안에 안 나타나면 목록 끝에 도달한 것
+        if page_posts is None:
+            logging.info(f"Post list not found on page {page}. End of pagination.")
+            return posts, True
 
-        post_elements = driver.find_elements(By.CSS_SELECTOR, "ul.post-list > li")
-        if not post_elements:
+        if not page_posts:
             logging.info(f"No posts found on page {page}. Checking the next page anyway...")
+        elif all(item.get("title") is None for item in page_posts):
+            # p.title → div.title 등으로 변경 필요할 수 있음
+            logging.warning("No post titles found on this page (layout change?). Stopping pagination.")
+            return posts, False
 
-        for post in post_elements:
-            try:
-                # p.title → div.title 등으로 변경 필요할 수 있음
-                title_element = post.find_element(By.CSS_SELECTOR, "p.title")
-                title = title_element.text.strip() if title_element.text.strip() else None
-
-                href = (
-                    post.find_element(By.TAG_NAME, "a").get_attribute("href").split("/")[-1]
-                    if post.find_element(By.TAG_NAME, "a").get_attribute("href")
-                    else None
-                )
+        for item in page_posts:
+            title = item.get("title") or None
+            href = item.get("href") or None
 
-                # "회원에 의해 삭제된 글입니다."는 제외
-                if title == "회원에 의해 삭제된 글입니다.":
-                    continue
+            # "회원에 의해 삭제된 글입니다." 등 시스템 문구는 제외
+            if title in _DELETED_TITLES:
+                continue
 
-                if title and href:
-                    posts.append({"title": title, "href": href})
+            # 이전 스캔에서 알던 글부터는 캐시로 대체하고 탐색 종료
+            # (캐시는 완주한 스캔만 저장되므로 결과도 완전하다)
+            if href in known_hrefs:
+                logging.info(f"Reached previously scanned post {href}. Using cached tail.")
+                return _merge_cached_tail(posts, cached_posts, href), True
 
-            except NoSuchElementException as e:
-                logging.warning("Failed to extract post details (NoSuchElementException). Stopping pagination.")
-                logging.warning(f"Detail: {e}")
-                return posts
-            except Exception as e:
-                logging.warning(f"Failed to extract post details: {e}")
+            if title and href:
+                posts.append({"title": title, "href": href})
 
         page += 1
 
-    return posts
+
+def _login_worker(username, pw, q):
+    """
+    Selenium 로그인 + 글 목록 추출을 백그라운드 스레드에서 수행한다.
+    결과는 큐로만 돌려주며, Tk 위젯은 여기서 절대 건드리지 않는다
+    (Tk는 스레드 안전하지 않으므로 UI 갱신은 메인 스레드 몫).
+
+    큐 메시지는 ("done", driver, (cookies, session, posts)) 또는
+    ("error", driver, 오류메시지) 형태의 3-튜플이다.
+    """
+    driver = None
+    try:
+        driver = _get_driver()
+        driver.get("https://login.orbi.kr/login")
+        wait_ready(driver)
+
+        # 로그인 시도
+        user_field = wait_for_element(driver, LOC_USERNAME_FIELD)
+        if not user_field:
+            q.put(("error", driver, "사용자명 입력란을 찾을 수 없습니다."))
+            return
+        user_field.send_keys(username)
+
+        pw_field = wait_for_element(driver, LOC_PASSWORD_FIELD)
+        if not pw_field:
+            q.put(("error", driver, "비밀번호 입력란을 찾을 수 없습니다."))
+            return
+        pw_field.send_keys(pw)
+        pw_field.submit()
+
+        # 로그인 성공 여부 확인
+        wait_ready(driver)
+        if not wait_for_element(driver, LOC_POST_LIST):
+            q.put(("error", driver, "로그인 실패 또는 게시글 목록을 찾을 수 없습니다."))
+            return
+
+        logging.info("Login successful!")
+        # 삭제 워커들이 물려받을 세션 쿠키
+        cookies = driver.get_cookies()
+
+        session = build_session(driver)
+        # 지난 스캔 캐시가 있으면 이미 알던 글 이후의 페이지는 건너뛴다
+        posts, complete = extract_posts(
+            driver, session=session, cached_posts=_load_cached_posts(username)
+        )
+        # 중간에 끊긴 스캔을 저장하면 다음 증분 스캔이 그 지점에서 멈춰
+        # 옛 글들이 영영 안 보이게 되므로, 완주한 스캔만 캐시한다
+        if complete:
+            _save_cached_posts(username, posts)
+        else:
+            logging.warning("Scan ended early; keeping the previous post cache.")
+        q.put(("done", driver, (cookies, session, posts)))
+
+    except Exception as e:
+        logging.error(f"An error occurred during login or extraction: {e}")
+        q.put(("error", driver, f"로그인/글 목록 처리 중 오류: {e}"))
 
 
 # -------------------- 메인 GUI --------------------
@@ -155,44 +663,68 @@ def run_gui():
     # 2) 결과(글 목록) 프레임
     result_frame = tk.Frame(root, padx=10, pady=10)
 
-    # 스크롤 가능한 캔버스 + 내부 프레임
-    canvas = tk.Canvas(result_frame, width=550, height=400)
-    canvas.pack(side=tk.LEFT, fill="both", expand=True)
-
-    scrollbar = ttk.Scrollbar(result_frame, orient="vertical", command=canvas.yview)
-    scrollbar.pack(side=tk.RIGHT, fill="y")
-
-    canvas.configure(yscrollcommand=scrollbar.set)
-    # 내부 내용을 담을 frame
-    posts_frame = tk.Frame(canvas)
-    canvas.create_window((0, 0), window=posts_frame, anchor="nw")
-
     # 전체 선택/해제 체크박스
     select_all_var = tk.BooleanVar()
-    select_all_cb = ttk.Checkbutton(posts_frame, text="모두 선택", variable=select_all_var)
+    select_all_cb = ttk.Checkbutton(result_frame, text="모두 선택", variable=select_all_var)
     select_all_cb.pack(anchor="w", pady=5)
 
+    # 가상화된 글 목록: Treeview는 보이는 행만 그리므로 글이 수천 개여도
+    # 글마다 위젯을 만들지 않는다
+    tree = ttk.Treeview(result_frame, columns=("sel", "title"), show="headings", height=20)
+    tree.heading("sel", text="선택")
+    tree.heading("title", text="제목")
+    tree.column("sel", width=50, anchor="center", stretch=False)
+    tree.column("title", width=480, anchor="w")
+    tree.pack(side=tk.LEFT, fill="both", expand=True)
+
+    tree_scrollbar = ttk.Scrollbar(result_frame, orient="vertical", command=tree.yview)
+    tree_scrollbar.pack(side=tk.RIGHT, fill="y")
+    tree.configure(yscrollcommand=tree_scrollbar.set)
+
     # 선택한 글 삭제 버튼
     delete_button = ttk.Button(root, text="선택한 글 삭제하기")
     delete_button.pack(pady=10, side=tk.BOTTOM)
 
-    # 체크박스 저장할 dict: index -> (BooleanVar, {title, href})
-    post_checks = {}
+    # 삭제 진행률 표시줄 (삭제 중에만 표시)
+    progress_var = tk.IntVar()
+    progress_bar = ttk.Progressbar(root, variable=progress_var)
+
+    # 선택 상태: posts_data와 같은 길이의 bytearray (행당 1바이트)
+    selected = bytearray()
 
     driver = None
     posts_data = []
+    session_cookies = []
+    http_session = None
+    login_username = ""
+
+    def on_tree_click(event):
+        # 선택 칸(#1) 클릭 시 해당 행의 체크 상태를 토글
+        if tree.identify_region(event.x, event.y) != "cell":
+            return
+        if tree.identify_column(event.x) != "#1":
+            return
+        row = tree.identify_row(event.y)
+        if not row:
+            return
+        idx = int(row)
+        selected[idx] ^= 1
+        tree.set(row, "sel", "☑" if selected[idx] else "☐")
 
     def on_select_all():
-        # 모두 선택 / 해제 시 모든 체크박스를 갱신
+        # 모두 선택 / 해제: 선택 플래그는 슬라이스 대입 한 번으로 뒤집고
+        # (행별 Tk 변수 이벤트 없음), 글리프만 행별로 갱신한다
         do_select = select_all_var.get()
-        for idx, (var, info) in post_checks.items():
-            var.set(do_select)
+        selected[:] = (b"\x01" if do_select else b"\x00") * len(selected)
+        glyph = "☑" if do_select else "☐"
+        for iid in tree.get_children():
+            tree.set(iid, "sel", glyph)
 
     def on_delete():
         # 삭제 버튼 클릭 시
         selected_posts = [
-            info for idx, (var, info) in post_checks.items()
-            if var.get()  # 체크된 항목만
+            posts_data[idx] for idx, flag in enumerate(selected)
+            if flag  # 체크된 항목만
         ]
 
         if not selected_posts:
@@ -204,85 +736,153 @@ def run_gui():
         if not confirm:
             return
 
-        # 실제 삭제 진행
-        for post_info in selected_posts:
-            delete_post(driver, post_info["href"])
+        # CSRF 토큰을 한 번 긁어올 수 있으면 삭제는 순수 HTTP POST로 진행
+        # (Chrome 불필요, 스레드 풀로 충분). 실패하면 Selenium 워커 폴백.
+        workers = min(MAX_DELETE_WORKERS, len(selected_posts))
+        token = (
+            _fetch_csrf_token(http_session, selected_posts[0]["href"])
+            if http_session is not None else None
+        )
+
+        if token:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            futures = [
+                executor.submit(delete_post_http, http_session, post_info["href"], token)
+                for post_info in selected_posts
+            ]
+        else:
+            # 각 워커 프로세스가 쿠키를 물려받은 헤드리스 Chrome을 하나씩 유지
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_delete_worker,
+                initargs=(session_cookies,),
+            )
+            futures = [
+                executor.submit(_delete_post_worker, post_info["href"])
+                for post_info in selected_posts
+            ]
+
+        delete_button.config(state="disabled")
+        progress_var.set(0)
+        progress_bar.config(maximum=len(futures))
+        progress_bar.pack(pady=5, side=tk.BOTTOM, fill="x", padx=10)
+
+        def poll_deletions():
+            # mainloop을 막지 않도록 after로 완료 개수만 폴링한다
+            done = sum(f.done() for f in futures)
+            progress_var.set(done)
+            if done < len(futures):
+                root.after(100, poll_deletions)
+                return
+
+            executor.shutdown(wait=False)
+            progress_bar.pack_forget()
+            delete_button.config(state="normal")
+
+            # 실제로 성공한 삭제만 캐시에서 뺀다 — 실패한 글까지 빼면
+            # 다음 증분 스캔에서 그 글이 캐시 꼬리 뒤에 영영 숨어버린다
+            deleted_hrefs = set()
+            failed = 0
+            for post_info, future in zip(selected_posts, futures):
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    logging.error(f"Deletion failed for post {post_info['href']}: {e}")
+                    ok = False
+                if ok:
+                    deleted_hrefs.add(post_info["href"])
+                else:
+                    failed += 1
+
+            # 캐시 갱신은 마지막으로 저장된 (완주한) 스캔을 기준으로 한다 —
+            # 이번 세션 스캔이 중간에 끊겼으면 posts_data는 불완전하므로
+            # 그걸 그대로 저장하면 안 된다. 캐시가 없으면 건드리지 않는다.
+            cached = _load_cached_posts(login_username)
+            if cached and deleted_hrefs:
+                _save_cached_posts(
+                    login_username,
+                    [p for p in cached if p["href"] not in deleted_hrefs],
+                )
+
+            if failed:
+                messagebox.showwarning(
+                    "완료",
+                    f"{len(deleted_hrefs)}개 글을 삭제했습니다. {failed}개는 실패했습니다.",
+                )
+            else:
+                messagebox.showinfo("완료", "선택한 글을 삭제했습니다.")
+            # 혹시 삭제 후 목록 갱신이 필요하다면, 여기에 재로딩 로직 추가 가능
+            # (이 예시는 간단히 안내 메시지만 표시하고 끝냅니다.)
+
+        root.after(100, poll_deletions)
 
-        messagebox.showinfo("완료", "선택한 글을 삭제했습니다.")
-        # 혹시 삭제 후 목록 갱신이 필요하다면, 아래처럼 재로딩 로직 추가 가능
-        # (이 예시는 간단히 안내 메시지만 표시하고 끝냅니다.)
+    login_queue = queue.Queue()
 
     def on_login():
-        nonlocal driver, posts_data
+        nonlocal login_username
 
         username = username_entry.get().strip()
         pw = password_entry.get().strip()
         if not username or not pw:
             messagebox.showerror("오류", "아이디와 비밀번호를 입력하세요.")
             return
-
-        # WebDriver 초기화
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920x1080")
-
+        login_username = username
+
+        # Selenium 작업은 워커 스레드로 보내고, 메인 루프는 계속 돌린다
+        login_button.config(state="disabled")
+        threading.Thread(
+            target=_login_worker, args=(username, pw, login_queue), daemon=True
+        ).start()
+        root.after(100, drain_login_queue)
+
+    def drain_login_queue():
+        # 워커 스레드가 결과를 넣을 때까지 100ms 간격으로 폴링
+        nonlocal driver, posts_data, session_cookies, http_session
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get("https://login.orbi.kr/login")
-
-            # 로그인 시도
-            user_field = wait_for_element(driver, By.NAME, "username")
-            if not user_field:
-                messagebox.showerror("오류", "사용자명 입력란을 찾을 수 없습니다.")
-                return
-            user_field.send_keys(username)
-
-            pw_field = wait_for_element(driver, By.NAME, "password")
-            if not pw_field:
-                messagebox.showerror("오류", "비밀번호 입력란을 찾을 수 없습니다.")
-                return
-            pw_field.send_keys(pw)
-            pw_field.submit()
-
-            # 로그인 성공 여부 확인
-            if not wait_for_element(driver, By.CLASS_NAME, "post-list"):
-                messagebox.showerror("오류", "로그인 실패 또는 게시글 목록을 찾을 수 없습니다.")
-                return
-
-            logging.info("Login successful!")
-
-            posts_data = extract_posts(driver)
-            if not posts_data:
-                messagebox.showinfo("알림", "'회원에 의해 삭제된 글'을 제외하고는 게시글이 없습니다.")
-                return
-
-            # 로그인 프레임 숨기고 결과 프레임 표시
-            login_frame.pack_forget()
-            result_frame.pack(fill="both", expand=True)
+            status, worker_driver, payload = login_queue.get_nowait()
+        except queue.Empty:
+            root.after(100, drain_login_queue)
+            return
 
-            # 모두 선택 체크박스의 콜백 설정
-            select_all_cb.config(command=on_select_all)
+        login_button.config(state="normal")
+        driver = worker_driver
 
-            # 글 목록 체크박스 생성
-            for idx, post in enumerate(posts_data):
-                var = tk.BooleanVar()
-                c = ttk.Checkbutton(posts_frame, text=post["title"], variable=var)
-                c.pack(anchor="w")
+        if status == "error":
+            messagebox.showerror("오류", payload)
+            return
 
-                post_checks[idx] = (var, post)
+        session_cookies, http_session, posts_data = payload
+        if not posts_data:
+            messagebox.showinfo("알림", "'회원에 의해 삭제된 글'을 제외하고는 게시글이 없습니다.")
+            return
 
-            # 스크롤 영역 크기를 갱신
-            posts_frame.update_idletasks()
-            canvas.config(scrollregion=canvas.bbox("all"))
+        # 글 목록을 Treeview에 채운다 — 행 데이터만 넣으면 실제 그리기는
+        # 화면에 보이는 행에 대해서만 일어난다. 프레임이 아직 화면에
+        # 없는 상태에서 채우므로 채우는 동안 리레이아웃도 일어나지 않는다.
+        selected[:] = bytes(len(posts_data))
+        for idx, post in enumerate(posts_data):
+            tree.insert("", "end", iid=str(idx), values=("☐", post["title"]))
 
-        except Exception as e:
-            logging.error(f"An error occurred during login or extraction: {e}")
-            messagebox.showerror("오류", f"로그인/글 목록 처리 중 오류: {e}")
+        # 로그인 프레임 숨기고 결과 프레임 표시 (레이아웃은 여기서 한 번)
+        login_frame.pack_forget()
+        result_frame.pack(fill="both", expand=True)
 
-    # 버튼에 함수 바인딩
+    # 버튼/체크박스에 함수 바인딩 (위젯 생성 직후 한 번만)
     login_button.config(command=on_login)
     delete_button.config(command=on_delete)
+    select_all_cb.config(command=on_select_all)
+    tree.bind("<Button-1>", on_tree_click)
+
+    def on_close():
+        # 창을 닫을 때 재사용하던 브라우저도 같이 종료
+        if _main_driver is not None:
+            try:
+                _main_driver.quit()
+            except Exception as e:
+                logging.warning(f"Failed to quit driver on close: {e}")
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
 
     root.mainloop()
 